@@ -6,9 +6,10 @@ see Signorovich et al (2012) (https://doi.org/10.1016/j.jval.2012.05.004).
 This implementation mirrors NICE's guidance in DSU Technical Support Document 18.
 """
 
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 import numpy as np
 import pandas as pd
 from scipy.optimize import minimize
@@ -190,12 +191,7 @@ class MAIC:
             raise e.NoWeightsException()
 
         # create grid
-        if len(variables) == 1:
-            ncols, nrows, remainder = 1, 1, 0
-        else:
-            ncols = min(ncols, len(variables))
-            nrows = (len(variables) - 1) // ncols + 1
-            remainder = nrows * ncols - len(variables)
+        nrows, ncols, remainder = _grid_shape(len(variables), ncols)
         fig, axes = plt.subplots(nrows, ncols, figsize=(ncols * 4, nrows * 4))
         fig.patch.set_facecolor("white")
         if len(variables) == 1:
@@ -205,6 +201,15 @@ class MAIC:
         for r in range(1, remainder + 1):
             axes[-r].axis("off")
 
+        self._draw_populations(axes, weighted, variables)
+        plt.close()
+
+        return fig
+
+    def _draw_populations(
+        self, axes: Sequence[Axes], weighted: bool, variables: list[str]
+    ):
+        """Draw the population comparison bar charts for `variables` onto `axes`"""
         # plot vars
         for var, ax in zip(variables, axes):
             if self.match[var][0] == "min":
@@ -264,9 +269,6 @@ class MAIC:
                     size=12,
                     weight="bold",
                 )
-        plt.close()
-
-        return fig
 
     def plot_weights(
         self, bins: Optional[Union[int, list[float]]] = None
@@ -290,10 +292,23 @@ class MAIC:
 
         fig, ax = plt.subplots(figsize=(8, 4))
         fig.patch.set_facecolor("white")
+        self._draw_weights(ax, bins)
+        plt.close()
+
+        return fig
+
+    def _draw_weights(self, ax: Axes, bins: Optional[Union[int, list[float]]]):
+        """Draw the histogram of scaled weights onto `ax`"""
         ax.hist(self.weights_scaled_, bins=bins, color=self._colours[0])
         ax.set_ylabel("count")
         ax.set_xlabel("weight (scaled)")
         ax.grid(axis="y")
-        plt.close()
 
-        return fig
+
+def _grid_shape(n_variables: int, ncols: int) -> Tuple[int, int, int]:
+    """Return the number of rows, columns and unused axes for a grid of plots"""
+    if n_variables == 1:
+        return 1, 1, 0
+    ncols = min(ncols, n_variables)
+    nrows = (n_variables - 1) // ncols + 1
+    return nrows, ncols, nrows * ncols - n_variables
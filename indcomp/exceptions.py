@@ -84,3 +84,17 @@ class ConfigException(Exception):
             "Match dictionary values require two items for 'mean', or three items for"
             + f" 'std'. Provided: '{self.vals}'"
         )
+
+
+class FormatException(Exception):
+    """Raised if an unsupported file format is requested for exported figures"""
+
+    def __init__(self, *args):
+        super().__init__()
+        self.fmt = args[0]
+
+    def __str__(self):
+        return (
+            "Supported file formats are ('png', 'pdf', 'svg'). "
+            + f"Provided: '{self.fmt}'"
+        )
@@ -0,0 +1,160 @@
+"""The `indcomp.report` module contains tools for exporting MAIC diagnostic figures.
+
+Figures are rendered with matplotlib's object-oriented Agg backend, without pyplot, so
+many fits can be rendered in parallel across a pool of worker processes. Each worker
+reuses its figure and axes templates between fits, and writes files directly to disk.
+"""
+
+import os
+import pathlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+import indcomp.exceptions as e
+from indcomp._maic import MAIC, _grid_shape
+
+SUPPORTED_FORMATS = ("png", "pdf", "svg")
+
+# figure templates cached per process, keyed by layout
+_TEMPLATES: Dict[Tuple, Figure] = {}
+
+
+def export_figures(
+    maics: Dict[str, MAIC],
+    path: Union[str, os.PathLike],
+    formats: Sequence[str] = ("png",),
+    variables: Optional[list[str]] = None,
+    ncols: int = 3,
+    bins: Optional[Union[int, list[float]]] = None,
+    dpi: Optional[float] = None,
+    n_jobs: Optional[int] = None,
+) -> List[pathlib.Path]:
+    """Render the diagnostic figures of many MAIC fits and write them to disk.
+
+    For each fit, the unweighted and weighted population comparisons (as per
+    `MAIC.compare_populations`) and the weights histogram (as per `MAIC.plot_weights`)
+    are written to `path` as `{name}_populations_unweighted.{format}`,
+    `{name}_populations_weighted.{format}` and `{name}_weights.{format}`.
+
+    Parameters
+    ----------
+    maics : Dict[str, MAIC]
+        Dictionary of MAIC instances to export, keyed by the name used to prefix their
+        files. `calc_weights()` must have been successfully run for each instance.
+    path : Union[str, os.PathLike]
+        Directory to write the figures to. Created if it does not exist.
+    formats : Sequence[str]
+        File formats to write each figure in (options: {'png', 'pdf', 'svg'}).
+        Defaults to ('png',).
+    variables : Optional[list[str]]
+        The names of the variables to compare, as per `MAIC.compare_populations`.
+        Defaults to None, which means the keys in each `match` dictionary will be used.
+    ncols : int
+        The number of columns to use in the grid of comparison plots. Defaults to 3.
+    bins : Optional[Union[int, list[float]]]
+        Bins for the weights histogram, as per `MAIC.plot_weights`. Defaults to None.
+    dpi : Optional[float]
+        Resolution of raster output. Defaults to None, which uses matplotlib's
+        `savefig.dpi` setting.
+    n_jobs : Optional[int]
+        The number of worker processes to render with. Defaults to None, which uses
+        the number of CPUs. If 1, figures are rendered in the current process.
+
+    Returns
+    -------
+    List[pathlib.Path]
+        The paths of the written files
+    """
+    for fmt in formats:
+        if fmt not in SUPPORTED_FORMATS:
+            raise e.FormatException(fmt)
+    for maic in maics.values():
+        if not maic.weights_calculated:
+            raise e.NoWeightsException()
+
+    path = pathlib.Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    settings = (path, tuple(formats), variables, ncols, bins, dpi)
+    jobs = [(name, maic) + settings for name, maic in maics.items()]
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs == 1 or len(jobs) <= 1:
+        results = map(_render_fit, jobs)
+        return [p for paths in results for p in paths]
+
+    # contiguous chunks let each worker reuse its templates across consecutive fits
+    chunksize = max(1, len(jobs) // (n_jobs * 4))
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        results = executor.map(_render_fit, jobs, chunksize=chunksize)
+        return [p for paths in results for p in paths]
+
+
+def _render_fit(job: Tuple) -> List[pathlib.Path]:
+    """Render and save all diagnostic figures for a single MAIC fit"""
+    name, maic, path, formats, variables, ncols, bins, dpi = job
+    variables = variables or list(maic.match.keys())
+
+    paths = []
+    for weighted, key in [(False, "unweighted"), (True, "weighted")]:
+        fig = _populations_figure(maic, weighted, variables, ncols)
+        paths += _save(fig, path / f"{name}_populations_{key}", formats, dpi)
+    paths += _save(_weights_figure(maic, bins), path / f"{name}_weights", formats, dpi)
+    return paths
+
+
+def _populations_figure(
+    maic: MAIC, weighted: bool, variables: list[str], ncols: int
+) -> Figure:
+    """Draw the population comparison onto a cached figure template"""
+    nrows, ncols, remainder = _grid_shape(len(variables), ncols)
+    fig = _template(("populations", nrows, ncols), (ncols * 4, nrows * 4))
+    if not fig.axes:
+        fig.subplots(nrows, ncols)
+    axes = _reset_axes(fig)
+    for r in range(1, remainder + 1):
+        axes[-r].axis("off")
+    maic._draw_populations(axes, weighted, variables)
+    return fig
+
+
+def _weights_figure(maic: MAIC, bins: Optional[Union[int, list[float]]]) -> Figure:
+    """Draw the weights histogram onto a cached figure template"""
+    fig = _template(("weights",), (8, 4))
+    if not fig.axes:
+        fig.subplots()
+    maic._draw_weights(_reset_axes(fig)[0], bins)
+    return fig
+
+
+def _template(key: Tuple, figsize: Tuple[float, float]) -> Figure:
+    """Retrieve the figure template for `key`, creating it on first use"""
+    if key not in _TEMPLATES:
+        fig = Figure(figsize=figsize)
+        FigureCanvasAgg(fig)
+        fig.patch.set_facecolor("white")
+        _TEMPLATES[key] = fig
+    return _TEMPLATES[key]
+
+
+def _reset_axes(fig: Figure) -> List[Axes]:
+    """Clear the axes of a figure template so it can be drawn on again"""
+    for ax in fig.axes:
+        ax.clear()
+        ax.set_axis_on()
+    return fig.axes
+
+
+def _save(
+    fig: Figure, stem: pathlib.Path, formats: Tuple[str], dpi: Optional[float]
+) -> List[pathlib.Path]:
+    """Write `fig` to disk in each of `formats`"""
+    paths = []
+    for fmt in formats:
+        file = stem.with_name(f"{stem.name}.{fmt}")
+        fig.savefig(file, format=fmt, dpi=dpi)
+        paths.append(file)
+    return paths
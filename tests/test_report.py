@@ -0,0 +1,51 @@
+"""Test suite for the `indcomp.report` module.
+"""
+
+import indcomp.exceptions as e
+import pytest
+from indcomp import MAIC
+from indcomp.datasets import load_NICE_DSU18
+from indcomp.report import export_figures
+
+
+@pytest.fixture
+def weighted_maics():
+    """Return a dictionary of MAIC instances with weights calculated"""
+    df_ind, df_tar = load_NICE_DSU18()
+    matches = {
+        "mean": {"age.mean": ("mean", "age")},
+        "mean_sd": {"age.mean": ("mean", "age"), "age.sd": ("std", "age", "age.mean")},
+    }
+    maics = {name: MAIC(df_ind, df_tar, match) for name, match in matches.items()}
+    for maic in maics.values():
+        maic.calc_weights()
+    return maics
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_export_figures(weighted_maics, tmp_path, n_jobs):
+    """Export figures in each supported format, serially and in parallel"""
+    formats = ["png", "pdf", "svg"]
+    paths = export_figures(weighted_maics, tmp_path, formats=formats, n_jobs=n_jobs)
+    expected = {
+        tmp_path / f"{name}_{figure}.{fmt}"
+        for name in weighted_maics
+        for figure in ["populations_unweighted", "populations_weighted", "weights"]
+        for fmt in formats
+    }
+    assert set(paths) == expected
+    assert all(p.stat().st_size > 0 for p in paths)
+
+
+def test_export_figures_invalid_format(weighted_maics, tmp_path):
+    """Request an unsupported file format"""
+    with pytest.raises(e.FormatException):
+        export_figures(weighted_maics, tmp_path, formats=["jpeg"])
+
+
+def test_export_figures_no_weights(tmp_path):
+    """Export figures before weights have been calculated"""
+    df_ind, df_tar = load_NICE_DSU18()
+    maic = MAIC(df_ind, df_tar, {"age.mean": ("mean", "age")})
+    with pytest.raises(e.NoWeightsException):
+        export_figures({"maic": maic}, tmp_path)